@@ -1,22 +1,116 @@
 __version__ = "0.1.0"
 
+import asyncio
 import enum
-from abc import ABC, abstractmethod
-from functools import lru_cache
-from typing import AsyncGenerator, Dict, List, Optional, Set, Type, Union
+import inspect
+import re
+import sys
+import time
+from abc import ABC, ABCMeta, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache, total_ordering
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import WeakValueDictionary
 
 import aiohttp
+import yarl
 
 try:
     from httpseekablefile import AsyncSeekableHTTPFile
 except ImportError:
     AsyncSeekableHTTPFile = None
 
+    async def _create_async_file(*args, **kwargs):
+        raise ImportError("httpseekablefile not installed")
 
+else:
+    _create_async_file = AsyncSeekableHTTPFile.create
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+_T = TypeVar("_T")
+
+_WHITESPACE = re.compile(r"\s")
+
+
+def _linear_time_regex(pattern: Pattern[str]) -> Pattern[str]:
+    # re2 matches in linear time (no backtracking), which matters when scanning long texts for URLs.
+    # Patterns re2 can't handle (e.g. with backreferences or non-default flags) are kept as they are.
+    if re2 is None or pattern.flags != re.UNICODE:
+        return pattern
+    options = re2.Options()
+    # Rejected pattern isn't an error here, don't let re2 log it to stderr
+    options.log_errors = False
+    try:
+        return re2.compile(pattern.pattern, options)
+    except re2.error:
+        return pattern
+
+
+def _words_matching(pattern: Pattern[str], long_string: str) -> Iterator[str]:
+    """Finds whitespace-delimited words starting with `pattern` match, the same ones `pattern.match` accepts
+    Whole words are yielded, even if `pattern` matches only their beginning or runs past their end.
+    After each match scanning resumes from the end of the current word, so match running past it doesn't hide
+    following words.
+
+    example:
+    >>> list(_words_matching(re.compile(r"https?://test\\.com/.+"), "see https://test.com/1 and https://test.com/2"))
+    ['https://test.com/1', 'https://test.com/2']
+
+    :param pattern: compiled regex matched against beginning of words
+    :param long_string: string to search for words in
+    :yield: matching words in order of appearance
+    """
+    pos = 0
+    while True:
+        match = pattern.search(long_string, pos)
+        if match is None:
+            return
+        start = match.start()
+        space = _WHITESPACE.search(long_string, start)
+        end = len(long_string) if space is None else space.start()
+        pos = max(end, start + 1)
+        if start and not long_string[start - 1].isspace():
+            # Match in the middle of a word, skip the rest of it
+            continue
+        # Match spanning whitespace doesn't mean the word alone matches
+        if match.end() <= end or pattern.match(long_string[start:end]):
+            yield long_string[start:end]
+
+
+def _as_url(url: Union[str, yarl.URL]) -> yarl.URL:
+    # aiohttp parses `str` URLs on every request, `yarl.URL` is passed through as is
+    return url if isinstance(url, yarl.URL) else yarl.URL(url)
+
+
+@lru_cache(maxsize=None)
 def plural_noun(val):
     # TODO [#26]: Plural noun rules
     #   https://www.grammarly.com/blog/plural-nouns/
-    return val + "s"
+    # Interned, as results are used as attribute names
+    return sys.intern(val + "s")
 
 
 class InvalidURL(Exception):
@@ -31,7 +125,28 @@ class InvalidSearchType(Exception):
     pass
 
 
-class AudioQuality(enum.Enum):
+class _AudioQualityMeta(enum.EnumMeta):
+    """Assigns each :class:`AudioQuality` member its rank (position in order of definition)
+
+    Done once at class creation, so comparing members doesn't need to scan `_member_names_`.
+    Lowest and highest members are stored as `_min` and `_max` on the class for the same reason.
+    """
+
+    def __new__(mcs, *args, **kwargs):
+        cls = super().__new__(mcs, *args, **kwargs)
+        members = list(cls)
+        for rank, member in enumerate(members):
+            # Kept on members rather than in class-level `{member: rank}` dict:
+            # enum's `__hash__` is implemented in Python, so dict lookup is ~10x slower than attribute load
+            member._rank = rank
+        if members:
+            cls._min = members[0]
+            cls._max = members[-1]
+        return cls
+
+
+@total_ordering
+class AudioQuality(enum.Enum, metaclass=_AudioQualityMeta):
     """Comparable enum for definition of track's audio quality
 
     Qualities are sorted in order of definition.
@@ -59,34 +174,85 @@ class AudioQuality(enum.Enum):
     False
     """
 
-    def __ge__(self, other):
-        if self.__class__ is other.__class__:
-            return self._member_names_.index(self.name) >= self._member_names_.index(other.name)
-        return NotImplemented
+    # Set by `_AudioQualityMeta`
+    _min: ClassVar["AudioQuality"]
+    _max: ClassVar["AudioQuality"]
 
-    def __gt__(self, other):
+    def __lt__(self, other):
         if self.__class__ is other.__class__:
-            return self._member_names_.index(self.name) > self._member_names_.index(other.name)
+            return self._rank < other._rank
         return NotImplemented
 
-    def __le__(self, other):
-        if self.__class__ is other.__class__:
-            return self._member_names_.index(self.name) <= self._member_names_.index(other.name)
-        return NotImplemented
 
-    def __lt__(self, other):
-        if self.__class__ is other.__class__:
-            return self._member_names_.index(self.name) < self._member_names_.index(other.name)
-        return NotImplemented
+class _RateLimiter:
+    """Token bucket allowing on average `rate` acquisitions per second, in bursts of up to `rate` (at least 1)"""
+
+    __slots__ = ("rate", "_capacity", "_tokens", "_updated")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        # Bucket has to hold at least one token, otherwise rates below 1 would never allow any acquisition
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._refill()
+        self._tokens -= 1
+
+    def pause(self, seconds: float):
+        # Drains the bucket, so nothing is acquired for `seconds`
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
+
 
+class _SessionMeta(ABCMeta):
+    """Checks abstract properties `_obj` and `_quality` of :class:`Session` subclasses
+    and that they can check URLs (with `_url_regex`, `_url_prefixes` or by overriding `is_valid_url`)
 
-class Session(ABC):
+    Done once when concrete subclass is created, instead of on every instantiation.
+    It's not done in `__init_subclass__`, as `ABCMeta` decides which classes are abstract only after it runs.
+    """
+
+    def __new__(mcs, *args, **kwargs):
+        cls = super().__new__(mcs, *args, **kwargs)
+        if not inspect.isabstract(cls):
+            for attr in ("_obj", "_quality"):
+                if not hasattr(cls, attr):
+                    raise TypeError(f"Can't create concrete class {cls} without abstract property {attr}")
+            if (
+                cls._url_regex is None
+                and not cls._url_prefixes
+                and inspect.getattr_static(cls, "is_valid_url") is Session.__dict__["is_valid_url"]
+            ):
+                raise TypeError(
+                    f"Can't create concrete class {cls} without _url_regex, _url_prefixes or is_valid_url override"
+                )
+        return cls
+
+
+class Session(ABC, metaclass=_SessionMeta):
     """Main abstract class holding session and other data neccessary to interact with the music service
 
     Starting point of the library.
     Can be used for storing auth or other data.
     Inheriting class should fill `_obj` and `_quality` with classes extending :class:`Object` and
     :class:`AudioQuality` respectively.
+    `_url_regex` can be set to compiled regex matching music service URLs (or just their beginning),
+    it's then used by :meth:`is_valid_url` and for finding URLs in :meth:`parse_urls`.
+    One of `_url_regex` and `_url_prefixes` has to be set, unless :meth:`is_valid_url` is overridden.
+    When `re2` extra is installed, the pattern is recompiled with `re2` to guarantee linear time matching.
+    `_url_prefixes` can be set to tuple of URL prefixes of the music service, strings not starting with any of them
+    are then rejected by :meth:`is_valid_url` with single `str.startswith` call, before matching `_url_regex`.
+    Like :class:`Object`, it declares `__slots__`, inheriting classes can declare their own for extra state.
 
     example:
     >>> class TestObject(Object, ABC):
@@ -100,24 +266,182 @@ class Session(ABC):
     >>> class TestSession(Session):
     ...     _obj = TestObject
     ...     _quality = TestAudioQuality
+    ...     _url_regex = re.compile(r"https?://(www\\.)?test\\.com/\\S+")
+    ...     _url_prefixes = ('https://test.com/', 'https://www.test.com/', 'http://test.com/', 'http://www.test.com/')
     ...     ...
     ...
     """
 
-    sess: aiohttp.ClientSession
+    __slots__ = ("_own_sess", "_required_audio_quality", "_preferred_audio_quality", "_obj_cache")
+
     _obj: Type["Object"]
     _quality: Type[AudioQuality]
+    _url_regex: Optional[Pattern[str]] = None
+    _url_prefixes: Tuple[str, ...] = ()
+    _shared_sess: Optional[aiohttp.ClientSession] = None
+    _shared_sess_loop: Optional[asyncio.AbstractEventLoop] = None
+    _connector_limit: int = 0
+    _connector_limit_per_host: int = 8
+    _dns_ttl: Optional[int] = 300
+    _keepalive_timeout: float = 30
+    _resolver_nameservers: Optional[List[str]] = None
+    _default_timeout: Optional[float] = 300
+    _max_requests_per_second: Optional[float] = None
+    _rate_limiters: Dict[Optional[str], _RateLimiter] = {}
+    max_parallel_urls: int = 16
+    _obj_cache_size: int = 1024
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Not inherited, so subclasses with different pool tuning get their own shared session and limits
+        cls._shared_sess = None
+        cls._shared_sess_loop = None
+        cls._rate_limiters = {}
+        if "_url_regex" in cls.__dict__ and cls._url_regex is not None:
+            cls._url_regex = _linear_time_regex(cls._url_regex)
 
     @abstractmethod
     def __init__(self, sess: Optional[aiohttp.ClientSession] = None):
-        if not hasattr(self.__class__, "_obj"):
-            raise TypeError(f"Can't instantiate abstract class {self.__class__} with abstract property _obj")
-        if not hasattr(self.__class__, "_quality"):
-            raise TypeError(f"Can't instantiate abstract class {self.__class__} with abstract property _quality")
+        # `None` when using shared session, it's then looked up on every access, as it may get recreated
+        self._own_sess: Optional[aiohttp.ClientSession] = sess
+        self._required_audio_quality: AudioQuality = self._quality._min
+        self._preferred_audio_quality: AudioQuality = self._quality._max
+        self._obj_cache: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+
+    @property
+    def sess(self) -> aiohttp.ClientSession:
+        """:class:`aiohttp.ClientSession` used by this session
+        The one passed to :class:`Session` (or assigned later), or the shared one (see :meth:`get_shared_session`)
+        if none was passed.
 
-        self.sess = aiohttp.ClientSession() if sess is None else sess
-        self._required_audio_quality: AudioQuality = min(self._quality)
-        self._preferred_audio_quality: AudioQuality = max(self._quality)
+        :return: underlying :class:`aiohttp.ClientSession`
+        """
+        return self.get_shared_session() if self._own_sess is None else self._own_sess
+
+    @sess.setter
+    def sess(self, sess: aiohttp.ClientSession):
+        self._own_sess = sess
+
+    @classmethod
+    def get_shared_session(cls) -> aiohttp.ClientSession:
+        """Gets :class:`aiohttp.ClientSession` shared by all instances of this :class:`Session` class
+        Session is created lazily on first use (or after previous one got closed, or event loop changed),
+        so connection pool, DNS cache and keep-alive connections are reused
+        by every :class:`Session` not given its own `sess`.
+
+        Connection pool can be tuned by overriding class attributes:
+        `_connector_limit` (total connections, 0 for no limit),
+        `_connector_limit_per_host` (connections to single host, 0 for no limit),
+        `_dns_ttl` (seconds DNS entries are cached for, `None` to cache forever),
+        `_keepalive_timeout` (seconds idle connections are kept open for),
+        `_resolver_nameservers` (when set, DNS is resolved asynchronously using these servers, requires `aiodns`)
+        `_default_timeout` (total request timeout in seconds),
+        and `_max_requests_per_second` (per host, see :meth:`rate_limit_trace_config`).
+        By default total amount of connections isn't limited, but only 8 connections to single host are allowed,
+        to avoid being rate limited by the music service.
+        If you use multiple music services and need different pool tuning, pass your own `sess` to :class:`Session`.
+
+        example:
+        >>> sess = TestSession()
+        >>> sess.sess is TestSession.get_shared_session()
+        True
+        >>> await TestSession.close_shared_session()
+
+        :return: shared :class:`aiohttp.ClientSession`
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if (
+            cls._shared_sess is None
+            or cls._shared_sess.closed
+            # Client is bound to the loop it was created in, e.g. it can't be reused by next `asyncio.run()`
+            or (loop is not None and loop is not cls._shared_sess_loop)
+        ):
+            resolver = (
+                aiohttp.AsyncResolver(nameservers=cls._resolver_nameservers) if cls._resolver_nameservers else None
+            )
+            cls._shared_sess = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=cls._connector_limit,
+                    limit_per_host=cls._connector_limit_per_host,
+                    ttl_dns_cache=cls._dns_ttl,
+                    keepalive_timeout=cls._keepalive_timeout,
+                    resolver=resolver,
+                ),
+                timeout=aiohttp.ClientTimeout(total=cls._default_timeout),
+                trace_configs=[cls.rate_limit_trace_config()] if cls._max_requests_per_second else None,
+            )
+            cls._shared_sess_loop = loop
+        return cls._shared_sess
+
+    @classmethod
+    async def close_shared_session(cls):
+        """Closes :class:`aiohttp.ClientSession` shared by instances of this :class:`Session` class
+        Should be called once you're done with the music service, if any :class:`Session` wasn't given its own `sess`.
+        It will be recreated by next :class:`Session` needing it.
+        """
+        shared_sess, cls._shared_sess, cls._shared_sess_loop = cls._shared_sess, None, None
+        if shared_sess is not None:
+            await shared_sess.close()
+
+    @classmethod
+    def rate_limit_trace_config(cls) -> aiohttp.TraceConfig:
+        """Creates :class:`aiohttp.TraceConfig` limiting rate of requests to `_max_requests_per_second` per host
+        Requests are delayed (smoothly, instead of failing and being retried) before being sent.
+        When the music service responds with `429 Too Many Requests` and numeric `Retry-After` header,
+        further requests to the host are held back for that time.
+        Limits are shared by all sessions of this :class:`Session` class.
+        Used automatically by :meth:`get_shared_session`, pass it in `trace_configs` when creating own `sess`.
+
+        example:
+        >>> sess = TestSession(aiohttp.ClientSession(trace_configs=[TestSession.rate_limit_trace_config()]))
+
+        :raises ValueError: when `_max_requests_per_second` isn't set
+        :return: trace config to be used by :class:`aiohttp.ClientSession`
+        """
+        rate = cls._max_requests_per_second
+        if not rate:
+            raise ValueError(f"{cls.__name__}._max_requests_per_second isn't set")
+
+        def limiter(host: Optional[str]) -> _RateLimiter:
+            if host not in cls._rate_limiters:
+                cls._rate_limiters[host] = _RateLimiter(rate)
+            return cls._rate_limiters[host]
+
+        async def on_request_start(session, ctx, params: aiohttp.TraceRequestStartParams):
+            await limiter(params.url.host).acquire()
+
+        async def on_request_end(session, ctx, params: aiohttp.TraceRequestEndParams):
+            retry_after = params.response.headers.get("Retry-After", "")
+            if params.response.status == 429 and retry_after.isdigit():
+                limiter(params.url.host).pause(int(retry_after))
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    async def open_seekable(self, url: Union[str, yarl.URL], filename: Optional[str] = None) -> AsyncSeekableHTTPFile:
+        """Opens async `filelike` object for file under `url` using this session
+        Every call opens new `filelike` positioned at start of the file,
+        it shares connection pool of :attr:`sess` with other requests.
+
+        :param url: URL of the file
+        :param filename: filename for `filelike` object
+        :raises ImportError: when `httpseekablefile` library is not installed
+        :return: async `filelike` with the file
+        """
+        return await _create_async_file(_as_url(url), filename, self.sess)
+
+    async def close(self):
+        """Closes :class:`aiohttp.ClientSession` passed to this :class:`Session`
+        Should be called once you're done with the music service.
+        Shared session is left open for other :class:`Session` instances, see :meth:`close_shared_session`.
+        """
+        if self._own_sess is not None:
+            await self._own_sess.close()
 
     @property
     def preferred_audio_quality(self) -> AudioQuality:
@@ -130,7 +454,7 @@ class Session(ABC):
 
     @preferred_audio_quality.setter
     def preferred_audio_quality(self, quality: AudioQuality):
-        if not isinstance(quality, self._quality):
+        if type(quality) is not self._quality:
             raise TypeError(f"quality must be instance of {self._quality}")
         self._preferred_audio_quality = quality
 
@@ -145,13 +469,15 @@ class Session(ABC):
 
     @required_audio_quality.setter
     def required_audio_quality(self, quality: AudioQuality):
-        if not isinstance(quality, self._quality):
+        if type(quality) is not self._quality:
             raise TypeError(f"quality must be instance of {self._quality}")
         self._required_audio_quality = quality
 
     async def object_from_url(self, url: str) -> "Object":
         """Fetches an object from the music service
         Automatically creates appropriate :class:`Object` type based on provided URL, e.g. Track, Playlist.
+        Objects are cached per :class:`Session` for up to `_obj_cache_size` most recently used URLs
+        (0 disables the cache), see :meth:`clear_object_cache`.
 
         example:
         >>> await sess.object_from_url('https://www.tidal.com/artist/17752')
@@ -161,26 +487,167 @@ class Session(ABC):
         :raises InvalidURL: when URL is being unparsable by music service
         :return: corresponding :class:`Object`, e.g. :class:`Track`
         """
-        for child_cls in self._obj.__subclasses__():
-            try:
+        if url not in self._obj_cache and not self._may_resolve(url):
+            raise InvalidURL
+        return await self._cached_object_from_url(url)
+
+    async def _cached_object_from_url(self, url: str) -> "Object":
+        # `object_from_url` without `_may_resolve` check, for callers which have already filtered URLs with it
+        # Results are cached as futures, so concurrent calls for the same URL share single fetch
+        fut = self._obj_cache.get(url)
+        if fut is None:
+            fut = asyncio.ensure_future(self._fetch_object_from_url(url))
+            self._obj_cache[url] = fut
+            if len(self._obj_cache) > self._obj_cache_size:
+                self._obj_cache.popitem(last=False)
+
+            def forget_failed(fut_: asyncio.Future):
+                if (fut_.cancelled() or fut_.exception() is not None) and self._obj_cache.get(url) is fut_:
+                    del self._obj_cache[url]
+
+            fut.add_done_callback(forget_failed)
+        else:
+            self._obj_cache.move_to_end(url)
+
+        # Shielded, so cancelling one of the waiters doesn't cancel fetch for the others
+        return await asyncio.shield(fut)
+
+    def clear_object_cache(self):
+        """Forgets objects cached by :meth:`object_from_url`, so they are fetched again on next call"""
+        self._obj_cache.clear()
+
+    async def _fetch_object_from_url(self, url: str) -> "Object":
+        for pattern, child_cls in self._url_dispatch_table():
+            if pattern is None:
+                # Object without declared URL patterns, have to try fetching it speculatively
+                obj = await child_cls.try_from_url(self, url)
+                if obj is not None:
+                    return obj
+            elif pattern.match(url):
                 return await child_cls.from_url(self, url)
-            except (InvalidURL, NotImplementedError):
-                pass
 
         # If none objects match url, then the url must be invalid
         raise InvalidURL
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _url_dispatch_table(cls) -> Tuple[Tuple[Optional[Pattern[str]], Type["Object"]], ...]:
+        """Builds table used by :meth:`object_from_url` to pick :class:`Object` type matching URL
+        Built once per :class:`Session` class from `_url_patterns` of concrete `_obj` subclasses,
+        rebuilt after new :class:`Object` subclass gets defined.
+        Subclasses declaring patterns go first, the ones without patterns are appended with `None` pattern.
+
+        :return: tuple of `(pattern, object_class)` pairs
+        """
+        with_patterns: List[Tuple[Optional[Pattern[str]], Type["Object"]]] = []
+        without_patterns: List[Tuple[Optional[Pattern[str]], Type["Object"]]] = []
+        for child_cls in cls._obj.concrete_subclasses():
+            if child_cls._url_patterns:
+                with_patterns.extend((pattern, child_cls) for pattern in child_cls._url_patterns)
+            else:
+                without_patterns.append((None, child_cls))
+        return tuple(with_patterns + without_patterns)
+
+    @classmethod
+    def resolve_class(cls, url: str) -> Optional[Type["Object"]]:
+        """Picks :class:`Object` type for URL synchronously, without any requests to the music service
+        Only types declaring `url_pattern` can be resolved this way.
+
+        example:
+        >>> TestSession.resolve_class('https://www.tidal.com/artist/17752')
+        <class 'tidal_async.api.Artist'>
+
+        :param url: music service URL pointing to object
+        :return: :class:`Object` type whose `url_pattern` matches `url`, `None` if there is no such type
+        """
+        for pattern, child_cls in cls._url_dispatch_table():
+            if pattern is None:
+                # Patterned entries go first, rest of the table can't be resolved without fetching
+                break
+            if pattern.match(url):
+                return child_cls
+        return None
+
+    @classmethod
+    def _may_resolve(cls, url: str) -> bool:
+        # `False` only when `url` is sure to raise `InvalidURL`, so no coroutine has to be created for it
+        table = cls._url_dispatch_table()
+        return bool(table) and (table[-1][0] is None or cls.resolve_class(url) is not None)
+
     @staticmethod
-    @abstractmethod
-    def is_valid_url(url) -> bool:
+    def _invalidate_subclass_cache():
+        Session._url_dispatch_table.cache_clear()
+
+    @classmethod
+    def is_valid_url(cls, url: str) -> bool:
         """Performs basic check if string looks like music service URL
+        Default implementation checks `url` against `_url_prefixes` and `_url_regex`.
 
         :param url: URL to check
+        :raises NotImplementedError: when neither `_url_regex` nor `_url_prefixes` is set and method is not overridden
+        :return: `True` if `url` looks like music service URL
         """
-        ...
+        if cls._url_prefixes and not url.startswith(cls._url_prefixes):
+            return False
+        if cls._url_regex is None:
+            if cls._url_prefixes:
+                return True
+            raise NotImplementedError
+        return cls._url_regex.match(url) is not None
+
+    def _find_urls(self, long_string: str) -> Iterator[str]:
+        if self._url_regex is None:
+            return (word for word in long_string.split() if self.is_valid_url(word))
+        # Single scan over the string, no need to split it and check every word
+        urls = _words_matching(self._url_regex, long_string)
+        if (
+            not self._url_prefixes
+            and inspect.getattr_static(type(self), "is_valid_url") is Session.__dict__["is_valid_url"]
+        ):
+            return urls
+        # `_url_prefixes` or overridden `is_valid_url` add checks, found URLs have to pass them as well
+        return (url for url in urls if self.is_valid_url(url))
+
+    async def _safe_object_from_url(self, url: str, sem: asyncio.Semaphore) -> Optional["Object"]:
+        # `url` has to be already checked with `_may_resolve`
+        async with sem:
+            try:
+                return await self._cached_object_from_url(url)
+            except InvalidURL:
+                return None
+
+    async def object_from_urls(
+        self, urls: Iterable[str], *, concurrency: Optional[int] = None
+    ) -> AsyncGenerator["Object", None]:
+        """Fetches objects from the music service for multiple URLs concurrently
+        Works like :meth:`object_from_url` called for every URL, but up to `concurrency` URLs are fetched at once.
+        Objects are yielded in order of completion, not in order of `urls`. Invalid URLs are skipped.
+
+        example:
+        >>> [o async for o in sess.object_from_urls(['https://www.tidal.com/artist/17752',
+        ...                                          'https://www.tidal.com/album/91969976'])]
+        [<tidal_async.api.Artist (17752): Psychostick>, <tidal_async.api.Album (91969976): Do>]
+
+        :param urls: music service URLs pointing to objects
+        :param concurrency: maximum amount of URLs being fetched at once, `max_parallel_urls` if ommited
+        :yield: music service objects for valid URLs
+        """
+        sem = asyncio.BoundedSemaphore(self.max_parallel_urls if concurrency is None else concurrency)
+        tasks = [asyncio.create_task(self._safe_object_from_url(url, sem)) for url in urls if self._may_resolve(url)]
+
+        try:
+            for coro in asyncio.as_completed(tasks):
+                obj = await coro
+                if obj is not None:
+                    yield obj
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def parse_urls(self, long_string: str) -> AsyncGenerator["Object", None]:
         """Parses `long_string` including music service URLs to corresponding music service objects
+        URLs are fetched concurrently (up to `max_parallel_urls` at once),
+        so objects are yielded in order of completion, not in order of appearance in `long_string`.
 
         example:
         >>> [o async for o in sess.parse_urls('''parsing https://www.tidal.com/artist/17752 topkek
@@ -194,12 +661,31 @@ class Session(ABC):
         #   What if for example one of URLs is invalid?
         #   ATM it would crash whole function and not parse any other URL
 
-        for word in long_string.split():
-            if self.is_valid_url(word):
-                try:
-                    yield await self.object_from_url(word)
-                except InvalidURL:
-                    pass
+        objs = self.object_from_urls(self._find_urls(long_string))
+        try:
+            async for obj in objs:
+                yield obj
+        finally:
+            await objs.aclose()
+
+    async def parse_urls_list(self, long_string: str) -> List["Object"]:
+        """Parses `long_string` including music service URLs to list of corresponding music service objects
+        Works like :meth:`parse_urls`, but returns all objects at once, in order of appearance in `long_string`.
+        Prefer it over :meth:`parse_urls` when all results are needed anyway, as it avoids per-object
+        async generator overhead. Use :meth:`parse_urls` to process objects as soon as they are fetched.
+
+        example:
+        >>> await sess.parse_urls_list('''parsing https://www.tidal.com/artist/17752 topkek
+        ... https://www.tidal.com/album/91969976 urls''')
+        [<tidal_async.api.Artist (17752): Psychostick>, <tidal_async.api.Album (91969976): Do>]
+
+        :param long_string: long string including URLs to music service objects
+        :return: music service objects for found URLs
+        """
+        sem = asyncio.BoundedSemaphore(self.max_parallel_urls)
+        urls = (url for url in self._find_urls(long_string) if self._may_resolve(url))
+        objs = await asyncio.gather(*(self._safe_object_from_url(url, sem) for url in urls))
+        return [obj for obj in objs if obj is not None]
 
     @abstractmethod
     async def search(
@@ -220,12 +706,67 @@ class Session(ABC):
         ...
 
 
-class Object(ABC):
+class _SessionBound:
+    """Common base of classes bound to :class:`Session`
+
+    Holds the only `sess` slot, so classes inheriting from more than one of them (e.g. both :class:`Object`
+    and :class:`Cover`) don't get conflicting instance layouts.
+    """
+
+    __slots__ = ("sess",)
+
+    sess: Session
+
+
+class Object(_SessionBound, ABC):
     """Abstract class representing music service object e.g. Track, Artist or Playlist
     Should be subclassed on API implementation of music service.
+
+    Subclasses can set `_url_patterns` to compiled regexes matching their URLs (or pass single pattern
+    as `url_pattern` class keyword), so :meth:`Session.object_from_url` calls :meth:`from_url`
+    only on matching :class:`Object` type.
+
+    example:
+    >>> class TestTrack(TestObject, Track, url_pattern=r"https?://(www\\.)?test\\.com/track/\\d+"):
+    ...     ...
+    ...
+
+    Base classes declare `__slots__`, so implementations declaring `__slots__` for their own attributes
+    don't carry per-instance `__dict__`.
     """
 
-    sess: Session
+    __slots__ = ()
+
+    _url_patterns: Tuple[Pattern[str], ...] = ()
+    _subclasses_cache: Dict[Type["Object"], Tuple[Type["Object"], ...]] = {}
+
+    def __init_subclass__(cls, url_pattern: Optional[Union[str, Pattern[str]]] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if url_pattern is not None:
+            cls._url_patterns = (re.compile(url_pattern),)
+        # Subclass caches and URL dispatch tables built from them, new class might need to be included
+        Object._subclasses_cache.clear()
+        Session._invalidate_subclass_cache()
+
+    @classmethod
+    def concrete_subclasses(cls) -> Tuple[Type["Object"], ...]:
+        """Gets all non-abstract (direct and indirect) subclasses of this :class:`Object` type
+        Result is cached until new :class:`Object` subclass gets defined.
+
+        :return: tuple of concrete subclasses in order of definition
+        """
+        subclasses = Object._subclasses_cache.get(cls)
+        if subclasses is None:
+
+            def walk(type_):
+                for sub in type_.__subclasses__():
+                    yield sub
+                    yield from walk(sub)
+
+            # dict.fromkeys removes duplicates coming from diamond inheritance, keeping the order
+            subclasses = tuple(sub for sub in dict.fromkeys(walk(cls)) if not inspect.isabstract(sub))
+            Object._subclasses_cache[cls] = subclasses
+        return subclasses
 
     @classmethod
     @abstractmethod
@@ -240,6 +781,22 @@ class Object(ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    async def try_from_url(cls, sess: Session, url: str) -> Optional["Object"]:
+        """Fetches corresponding object from music service based on URL, if URL points to this :class:`Object` type
+        Used by :meth:`Session.object_from_url` for :class:`Object` types without `_url_patterns`.
+        Default implementation calls :meth:`from_url` and swallows its exceptions,
+        override it to reject URLs without raising exceptions.
+
+        :param sess: :class:`Session` instance to use when loading data from music service
+        :param url: music service URL pointing to object
+        :return: corresponding object or `None` when URL doesn't point to this :class:`Object` type
+        """
+        try:
+            return await cls.from_url(sess, url)
+        except (InvalidURL, NotImplementedError):
+            return None
+
     @classmethod
     @abstractmethod
     async def from_id(cls, sess: Session, id_) -> "Object":
@@ -252,7 +809,7 @@ class Object(ABC):
         ...
 
     @abstractmethod
-    async def get_url(self) -> str:
+    async def get_url(self) -> Union[str, yarl.URL]:
         """Gets object's URL
 
         :return: URL to object
@@ -282,13 +839,16 @@ class Searchable(Object, ABC):
     playlists, `Track` and `Playlist` classes should extend this class.
     """
 
+    __slots__ = ()
 
-class Cover(ABC):
-    sess: Session
+
+class Cover(_SessionBound, ABC):
+    __slots__ = ()
 
     @abstractmethod
-    def get_url(self, *args, **kwargs) -> str:
+    def get_url(self, *args, **kwargs) -> Union[str, yarl.URL]:
         """Gets :class:`Cover` image URL
+        Returning already parsed :class:`yarl.URL` saves `aiohttp` from parsing it again on every request.
 
         :param args: allows overriding function to define custom positional arguments
         :param kwargs: allows overriding function to define custom keyword arguments
@@ -298,6 +858,7 @@ class Cover(ABC):
 
     async def get_async_file(self, filename: Optional[str] = None, *args, **kwargs) -> AsyncSeekableHTTPFile:
         """Gets async `filelike` object containing cover art
+        Opened using :meth:`Session.open_seekable`.
 
         :param args: allows subfunction to define custom positional arguments
         :param kwargs: allows subfunction to define custom keyword arguments
@@ -305,17 +866,12 @@ class Cover(ABC):
         :raises ImportError: when `httpseekablefile` library is not installed
         :return: async `filelike` with coverart
         """
-        if AsyncSeekableHTTPFile is None:
-            raise ImportError("httpseekablefile not installed")
-
-        return await AsyncSeekableHTTPFile.create(
-            self.get_url(*args, **kwargs),
-            filename,
-            self.sess.sess,
-        )
+        return await self.sess.open_seekable(self.get_url(*args, **kwargs), filename)
 
 
 class Track(Object, ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def title(self) -> str:
@@ -333,10 +889,21 @@ class Track(Object, ABC):
         ...
 
     @abstractmethod
-    async def get_metadata(self) -> Dict[str, str]:
+    async def get_metadata(self) -> Mapping[str, str]:
         """Generates metadata for music file to be tagged with
+        Returned mapping is read-only for callers, so implementation can build it once
+        and return the same :class:`types.MappingProxyType` on subsequent calls.
 
-        :return: dict containing tags compatbile with `mediafile` library
+        example:
+        >>> class TestTrack(Track):
+        ...     _metadata = None
+        ...     async def get_metadata(self):
+        ...         if self._metadata is None:
+        ...             self._metadata = types.MappingProxyType({"title": self.title, "artist": self.artist_name})
+        ...         return self._metadata
+        ...
+
+        :return: mapping containing tags compatbile with `mediafile` library
         """
         ...
 
@@ -346,8 +913,9 @@ class Track(Object, ABC):
         required_quality: Optional[AudioQuality] = None,
         preferred_quality: Optional[AudioQuality] = None,
         **kwargs,
-    ) -> str:
+    ) -> Union[str, yarl.URL]:
         """Fetches direct URL to music file from music service
+        Returning already parsed :class:`yarl.URL` saves `aiohttp` from parsing it again on every request.
 
         :param required_quality: required (lower limit) :class:`AudioQuality` for track
         if ommited value from session is used
@@ -367,6 +935,7 @@ class Track(Object, ABC):
         **kwargs,
     ) -> AsyncSeekableHTTPFile:
         """Gets async `filelike` object containing track file
+        Opened using :meth:`Session.open_seekable`.
 
         :param required_quality: required (lower limit) :class:`AudioQuality` for track
         if ommited value from session is used
@@ -378,16 +947,137 @@ class Track(Object, ABC):
         :raises InsufficientAudioQuality: when available :class:`AudioQuality` is lower than `required_quality`
         :return: async `filelike` with music file
         """
-        if AsyncSeekableHTTPFile is None:
-            raise ImportError("httpseekablefile not installed")
-
-        return await AsyncSeekableHTTPFile.create(
+        return await self.sess.open_seekable(
             await self.get_file_url(required_quality, preferred_quality, **kwargs),
             self.title if filename is None else filename,
-            self.sess.sess,
         )
 
 
+def collects(collection_type: Type[Object]):
+    """Decorator marking method of :class:`ObjectCollection` subclass as the one collecting `collection_type`
+    Allows naming the method differently than `plural_noun(collection_type_name)`,
+    method is then also available under that name.
+
+    example:
+    >>> class Album(ObjectCollection[Track]):
+    ...     from_id = from_url = get_id = get_url = cover = lambda *a, **b: None
+    ...     @collects(Track)
+    ...     async def get_tracks(self):
+    ...         for i in range(5):
+    ...             yield f"Track {i}"
+    ...
+
+    :param collection_type: :class:`Object` type collected by decorated method
+    :return: decorator marking the method
+    """
+
+    def decorator(func):
+        func._collects = collection_type
+        return func
+
+    return decorator
+
+
+def _collector_alias(name: str, alias_name: str) -> Callable[..., AsyncGenerator[Object, None]]:
+    def alias(self, *args, **kwargs):
+        return getattr(self, name)(*args, **kwargs)
+
+    alias.__name__ = alias_name
+    return alias
+
+
+class _CollectionHelper:
+    """Common base of all :class:`ObjectCollection` parameterizations
+
+    Defined once, parameterizations only add `_collection_type` and abstract method for it.
+    """
+
+    __slots__ = ()
+
+    collection_of: Set[Type[Object]] = set()
+    _collection_type: Type[Object]
+    _collection_method: str
+    _iter_methods: Dict[Type[Object], str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Fresh dict and set for every class, gathered from all bases it inherits from,
+        # so method names picked with `@collects` are inherited as well
+        cls._iter_methods = {}
+        for base in reversed(cls.__mro__[1:]):
+            cls._iter_methods.update(base.__dict__.get("_iter_methods", {}))
+        if "_collection_type" in cls.__dict__:
+            cls._iter_methods[cls._collection_type] = cls._collection_method
+        cls.collection_of = set(cls._iter_methods)
+        cls._register_collectors()
+
+    @classmethod
+    def _marked_collectors(cls) -> Dict[Type[Object], str]:
+        # Names of methods marked with `@collects` in this class
+        collected = {}
+        for name, func in cls.__dict__.items():
+            collection_type = getattr(func, "_collects", None)
+            if collection_type is None:
+                continue
+            if collection_type not in cls._iter_methods:
+                raise TypeError(f"{cls.__name__}.{name} collects {collection_type}, which isn't in {cls.__name__}")
+            collected[collection_type] = name
+        return collected
+
+    @classmethod
+    def _register_collectors(cls):
+        collected = cls._marked_collectors()
+        for collection_type, name in collected.items():
+            cls._iter_methods[collection_type] = name
+            conventional_name = plural_noun(collection_type.__name__.lower())
+            if conventional_name not in cls.__dict__:
+                # Expose method marked with `@collects` under its conventional name,
+                # before ABCMeta decides if the class is still abstract.
+                # Looked up by name on every call, so overrides of the marked method are honoured.
+                setattr(cls, conventional_name, _collector_alias(name, conventional_name))
+
+        for collection_type in cls._iter_methods.keys() - collected.keys():
+            conventional_name = plural_noun(collection_type.__name__.lower())
+            if conventional_name in cls.__dict__:
+                # Method with conventional name overridden, it replaces the one marked with `@collects` in base class
+                cls._iter_methods[collection_type] = conventional_name
+
+    def iter(self, collection_type_: Type[Object], *args, **kwargs) -> AsyncGenerator[Object, None]:
+        return getattr(self, self._iter_methods[collection_type_])(*args, **kwargs)
+
+    async def collect(
+        self, collection_type_: Type[Object], op: Callable[[Any], Awaitable[_T]], concurrency: int = 16
+    ) -> List[Tuple[Any, _T]]:
+        """Runs `op` on every object of `collection_type_` in collection concurrently
+        Useful for follow-up requests for each object, e.g. fetching metadata of all tracks of an album.
+        `op` is started for each object as soon as it's yielded from collection, up to `concurrency` at once.
+
+        example:
+        >>> [(t.title, m) for t, m in await album.collect(Track, lambda t: t.get_metadata())]
+        [('Track 0', {...}), ('Track 1', {...})]
+
+        :param collection_type_: type of collected objects to run `op` on
+        :param op: coroutine function called with each object
+        :param concurrency: maximum amount of `op` calls running at once
+        :raises KeyError: when `collection_type_` isn't collected by this collection
+        :return: list of `(object, op result)` pairs in order of collection
+        """
+        sem = asyncio.BoundedSemaphore(concurrency)
+
+        async def run(obj):
+            async with sem:
+                return obj, await op(obj)
+
+        tasks = []
+        try:
+            async for obj in self.iter(collection_type_):
+                tasks.append(asyncio.ensure_future(run(obj)))
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
 class ObjectCollection:
     """Base class for any collections of objects
 
@@ -407,6 +1097,7 @@ class ObjectCollection:
 
     **You cannot create `ObjectCollection[Track]` subclass without method `tracks()`.**
     Way of creating method names are defined by `plural_noun(obj_name)` function.
+    Method named differently can be used instead when marked with :func:`collects` decorator.
 
     Now you can iterate over collection two ways.
     Normal way - using programmer friendly method:
@@ -490,6 +1181,9 @@ class ObjectCollection:
     Playlist 4
     """
 
+    # Parameterizations are kept only as long as something (e.g. subclass) uses them
+    _parameterized: "WeakValueDictionary[Type[Object], type]" = WeakValueDictionary()
+
     def __new__(cls):
         raise TypeError(f"Can't instantiate this class directly. Try {cls.__name__}[Object]")
 
@@ -497,34 +1191,28 @@ class ObjectCollection:
         raise TypeError("Can't subclass this class directly. Try ObjectCollection[Object]")
 
     @classmethod
-    @lru_cache()
     def __class_getitem__(cls, collection_type: Type[Object]):
+        cached = cls._parameterized.get(collection_type)
+        if cached is not None:
+            return cached
+
         if not issubclass(collection_type, Object):
             raise TypeError(f"index must be subclass of Object, not {collection_type}")
 
-        class CollectionHelper:
-            collection_of: Set[Type[Object]] = set()
-
-            def __init_subclass__(cls, **kwargs):
-                super().__init_subclass__(**kwargs)
-                if cls.collection_of:
-                    cls.collection_of.add(collection_type)
-                else:
-                    cls.collection_of = {collection_type}
-
-            def iter(self, collection_type_: Type[Object], *args, **kwargs) -> AsyncGenerator[Object, None]:
-                if collection_type_ in self.collection_of:
-                    func_name_ = plural_noun(collection_type_.__name__.lower())
-                    return getattr(self, func_name_)(*args, **kwargs)
-                raise KeyError(collection_type_)
-
         async def _load_collections(self, *args, **kwargs) -> AsyncGenerator[Object, None]:
             ...
 
         _load_collections.__name__ = func_name = plural_noun(collection_type.__name__.lower())
 
-        return type(
+        cls._parameterized[collection_type] = parameterized = type(
             f"ObjectCollection[{collection_type.__name__}]",
-            (Object, CollectionHelper, ABC),
-            {"__module__": cls.__module__, func_name: abstractmethod(_load_collections)},
+            (Object, _CollectionHelper, ABC),
+            {
+                "__module__": cls.__module__,
+                "__slots__": (),
+                "_collection_type": collection_type,
+                "_collection_method": func_name,
+                func_name: abstractmethod(_load_collections),
+            },
         )
+        return parameterized